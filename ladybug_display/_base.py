@@ -1,7 +1,20 @@
 # coding: utf-8
 """Base class for all geometry objects."""
+from ladybug.color import Color
+
 LINE_TYPES = ('Continuous', 'Dashed', 'Dotted', 'DashDot')
+_LINE_TYPES_LOWER = {key.lower(): key for key in LINE_TYPES}
 DISPLAY_MODES = ('Surface', 'SurfaceWithEdges', 'Wireframe', 'Points')
+_DISPLAY_MODES_LOWER = {key.lower(): key for key in DISPLAY_MODES}
+
+
+def _color_from_dict(data):
+    """Get a ladybug Color from its dictionary without re-validating the type key.
+
+    Args:
+        data: A dictionary of a ladybug Color with r, g, b and an optional a key.
+    """
+    return Color(data['r'], data['g'], data['b'], data.get('a', 255))
 
 
 class _DisplayBase(object):
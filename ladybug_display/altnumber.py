@@ -35,3 +35,4 @@ class Default(_AltNumber):
 
 
 default = Default()
+DEFAULT_DICT = default.to_dict()  # used to recognize default in serialized data
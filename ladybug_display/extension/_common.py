@@ -0,0 +1,18 @@
+"""Utilities shared by the methods that translate ladybug charts to VisualizationSets."""
+from ladybug_geometry.geometry3d import Point3D, Plane
+
+
+def _plane_at_z(plane, z):
+    """Get a Plane with its origin at a given Z value.
+
+    The input plane is returned as it is if its origin is already at the Z value.
+    This is safe since ladybug_geometry Planes are immutable.
+
+    Args:
+        plane: A Plane to be positioned at the Z value.
+        z: The Z value for the plane origin.
+    """
+    o = plane.o
+    if o.z == z:
+        return plane
+    return Plane(n=plane.n, o=Point3D(o.x, o.y, z), x=plane.x)
@@ -9,6 +9,7 @@ from ladybug_display.geometry3d import DisplayLineSegment3D, DisplayPolyline3D,
     DisplayText3D
 from ladybug_display.visualization import VisualizationSet, AnalysisGeometry, \
     VisualizationData, ContextGeometry
+from ._common import _plane_at_z
 
 
 def adaptive_chart_to_vis_set(
@@ -65,8 +66,7 @@ def adaptive_chart_to_vis_set(
         ['{}: {}'.format(k, v) for k, v in meta_i]
     ttl_pl = adaptive_chart.container.lower_title_location.move(
         Vector3D(0, -txt_hgt * 3))
-    if z != 0:
-        ttl_pl = Plane(n=ttl_pl.n, o=Point3D(ttl_pl.o.x, ttl_pl.o.y, z), x=ttl_pl.x)
+    ttl_pl = _plane_at_z(ttl_pl, z)
     ttl_txt = DisplayText3D(
         '\n'.join(title_items), ttl_pl, txt_hgt * 1.5, None, font, 'Left', 'Top')
     border_geo = Polyline3D.from_polyline2d(
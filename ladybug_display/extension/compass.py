@@ -64,35 +64,25 @@ def compass_to_vis_set(compass, z=0, custom_angles=None, projection=None, font='
         lw = 2 if i == 0 else 1
         result.append(DisplayArc3D(Arc3D.from_arc2d(circle, z), line_width=lw))
 
-    # create a method that translates LineSegment2D into DisplayLineSegment3D
-    def from_linesegment2d(line, z, line_width=1):
-        pt_array = ((line.p1.x, line.p1.y, z), (line.p2.x, line.p2.y, z))
-        ls_3d = LineSegment3D.from_array(pt_array)
-        return DisplayLineSegment3D(ls_3d, line_width=line_width)
-
-    # generate the labels and tick marks for the azimuths
+    # group the tick marks and labels for the azimuths
     if custom_angles is None:
-        for line in compass.major_azimuth_ticks:
-            result.append(from_linesegment2d(line, z, 2))
-        for txt, pt in zip(compass.MAJOR_TEXT, compass.major_azimuth_points):
-            txt_pln = Plane(o=Point3D(pt.x, pt.y, z), x=xaxis)
-            result.append(
-                DisplayText3D(txt, txt_pln, maj_txt, None, font, 'Center', 'Middle'))
+        az_groups = [(compass.major_azimuth_ticks, 2, compass.MAJOR_TEXT,
+                      compass.major_azimuth_points, maj_txt)]
         if min_txt > 0:
-            for line in compass.minor_azimuth_ticks:
-                result.append(from_linesegment2d(line, z))
-            for txt, pt in zip(compass.MINOR_TEXT, compass.minor_azimuth_points):
-                txt_pln = Plane(o=Point3D(pt.x, pt.y, z), x=xaxis)
-                result.append(
-                    DisplayText3D(txt, txt_pln, min_txt, None, font, 'Center', 'Middle'))
+            az_groups.append((compass.minor_azimuth_ticks, 1, compass.MINOR_TEXT,
+                              compass.minor_azimuth_points, min_txt))
     else:
-        for line in compass.ticks_from_angles(custom_angles):
-            result.append(from_linesegment2d(line, z))
-        for txt, pt in zip(
-                custom_angles, compass.label_points_from_angles(custom_angles)):
-            t_pln = Plane(o=Point3D(pt.x, pt.y, z), x=xaxis)
-            d_t = DisplayText3D(str(txt), t_pln, maj_txt, None, font, 'Center', 'Middle')
-            result.append(d_t)
+        az_groups = [(compass.ticks_from_angles(custom_angles), 1,
+                      [str(ang) for ang in custom_angles],
+                      compass.label_points_from_angles(custom_angles), maj_txt)]
+
+    # generate the labels and tick marks for the azimuths
+    for ticks, lw, labels, label_pts, txt_size in az_groups:
+        result.extend(_line2d_to_display3d(line, z, lw) for line in ticks)
+        result.extend(
+            DisplayText3D(txt, Plane(o=Point3D(pt.x, pt.y, z), x=xaxis), txt_size,
+                          None, font, 'Center', 'Middle')
+            for txt, pt in zip(labels, label_pts))
 
     # generate the labels and tick marks for the altitudes
     if projection is not None:
@@ -118,3 +108,16 @@ def compass_to_vis_set(compass, z=0, custom_angles=None, projection=None, font='
     # assemble everything into a ContextGeometry and VisualizationSet
     con_geo = ContextGeometry('Compass', result)
     return VisualizationSet('Compass', [con_geo])
+
+
+def _line2d_to_display3d(line, z, line_width=1):
+    """Translate a LineSegment2D into a DisplayLineSegment3D.
+
+    Args:
+        line: A LineSegment2D to be translated.
+        z: The Z value for the line segment.
+        line_width: A number for the line width of the line segment. (Default: 1).
+    """
+    pt_array = ((line.p1.x, line.p1.y, z), (line.p2.x, line.p2.y, z))
+    ls_3d = LineSegment3D.from_array(pt_array)
+    return DisplayLineSegment3D(ls_3d, line_width=line_width)
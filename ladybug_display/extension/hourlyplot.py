@@ -38,7 +38,7 @@ def hourly_plot_to_vis_set(
     """
     # establish the VisualizationSet object
     data_header = hourly_plot.data_collection.header
-    data_type, unit = data_header.data_type, data_header.unit
+    data_type = data_header.data_type
     set_id = 'Hourly_Plot_{}'.format(data_type.name.replace(' ', '_'))
     vis_set = VisualizationSet(set_id, ())
 
@@ -89,8 +89,8 @@ def hourly_plot_to_vis_set(
         vis_set.add_geometry(title)
 
     # add the colored mesh
-    vis_data = VisualizationData(
-        hourly_plot.values, hourly_plot.legend_parameters, data_type, unit)
+    vis_data = VisualizationData.from_data_collection(
+        hourly_plot.data_collection, hourly_plot.legend_parameters)
     mesh_geo = AnalysisGeometry(
         'Analysis_Data', [hourly_plot.colored_mesh3d], [vis_data])
     mesh_geo.display_name = data_type.name
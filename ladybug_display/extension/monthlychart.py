@@ -6,6 +6,7 @@ from ladybug_display.geometry3d import DisplayLineSegment3D, DisplayPolyline3D,
     DisplayText3D
 from ladybug_display.visualization import VisualizationSet, AnalysisGeometry, \
     VisualizationData, ContextGeometry
+from ._common import _plane_at_z
 
 
 def monthly_chart_to_vis_set(
@@ -94,9 +95,7 @@ def monthly_chart_to_vis_set(
         y1_txt = monthly_chart.y_axis_title_text1
     else:
         y1_txt = y_axis_title if isinstance(y_axis_title, str) else y_axis_title[0]
-    y_pl = monthly_chart.y_axis_title_location1
-    if z != 0:
-        y_pl = Plane(n=y_pl.n, o=Point3D(y_pl.o.x, y_pl.o.y, z), x=y_pl.x)
+    y_pl = _plane_at_z(monthly_chart.y_axis_title_location1, z)
     y_title = DisplayText3D(y1_txt, y_pl, txt_hgt, None, font)
     y_geo.append(y_title)
     for txt, pt in zip(monthly_chart.y_axis_labels1, monthly_chart.y_axis_label_points1):
@@ -115,9 +114,7 @@ def monthly_chart_to_vis_set(
         else:
             y2_txt = monthly_chart.y_axis_title_text2 \
                 if isinstance(y_axis_title, str) else y_axis_title[1]
-        y2_pl = monthly_chart.y_axis_title_location2
-        if z != 0:
-            y2_pl = Plane(n=y2_pl.n, o=Point3D(y2_pl.o.x, y2_pl.o.y, z), x=y2_pl.x)
+        y2_pl = _plane_at_z(monthly_chart.y_axis_title_location2, z)
         y_title2 = DisplayText3D(y2_txt, y2_pl, txt_hgt, None, font)
         y2_geo.append(y_title2)
         y2_label_pts = monthly_chart.y_axis_label_points2
@@ -131,9 +128,7 @@ def monthly_chart_to_vis_set(
 
     # add the title
     title_txt = monthly_chart.title_text if global_title is None else global_title
-    ttl_pl = monthly_chart.lower_title_location
-    if z != 0:
-        ttl_pl = Plane(n=ttl_pl.n, o=Point3D(ttl_pl.o.x, ttl_pl.o.y, z), x=ttl_pl.x)
+    ttl_pl = _plane_at_z(monthly_chart.lower_title_location, z)
     title = DisplayText3D(title_txt, ttl_pl, txt_hgt, None, font)
     title_obj = ContextGeometry('Title', [title])
     vis_set.add_geometry(title_obj)
@@ -1,4 +1,6 @@
 """Method to draw an PsychrometricChart as a VisualizationSet."""
+from bisect import bisect_right
+
 from ladybug_geometry.geometry3d import Vector3D, Point3D, Plane, LineSegment3D, \
     Polyline3D, Mesh3D
 from ladybug.datatype.time import Time
@@ -9,6 +11,9 @@ from ladybug_display.geometry3d import DisplayLineSegment3D, DisplayPolyline3D,
     DisplayText3D
 from ladybug_display.visualization import VisualizationSet, AnalysisGeometry, \
     VisualizationData, ContextGeometry
+from ._common import _plane_at_z
+
+_XY_PLANE = Plane()  # shared base plane for the common case of charts at Z = 0
 
 
 def psychrometric_chart_to_vis_set(
@@ -68,7 +73,7 @@ def psychrometric_chart_to_vis_set(
     # get values used throughout the translation
     txt_hgt = psych_chart.legend_parameters.text_height
     font = psych_chart.legend_parameters.font
-    bp = Plane(o=Point3D(0, 0, z))
+    bp = _plane_at_z(_XY_PLANE, z)
 
     # add the title and border
     if isinstance(psych_chart.temperature, BaseCollection):
@@ -76,9 +81,7 @@ def psychrometric_chart_to_vis_set(
         title_items = ['Time [hr]'] + ['{}: {}'.format(k, v) for k, v in meta_i]
     else:
         title_items = ['Psychrometric Chart']
-    ttl_pl = psych_chart.container.upper_title_location
-    if z != 0:
-        ttl_pl = Plane(n=ttl_pl.n, o=Point3D(ttl_pl.o.x, ttl_pl.o.y, z), x=ttl_pl.x)
+    ttl_pl = _plane_at_z(psych_chart.container.upper_title_location, z)
     ttl_txt = DisplayText3D(
         '\n'.join(title_items), ttl_pl, txt_hgt * 1.5, None, font, 'Left', 'Top')
     border_geo = Polyline3D.from_polyline2d(psych_chart.chart_border, bp)
@@ -93,14 +96,11 @@ def psychrometric_chart_to_vis_set(
     temp_txt = DisplayText3D(
         psych_chart.x_axis_text, tm_pl, txt_hgt * 1.5, None, font, 'Left', 'Top')
     temp_geo = [temp_txt]
-    for tl in psych_chart.temperature_lines:
-        tl_geo = LineSegment3D.from_line_segment2d(tl, z)
-        temp_geo.append(DisplayLineSegment3D(tl_geo))
-    tl_pts = psych_chart.temperature_label_points
-    for txt, pt in zip(psych_chart.temperature_labels, tl_pts):
-        t_pln = Plane(o=Point3D(pt.x, pt.y, z))
-        txt_obj = DisplayText3D(txt, t_pln, txt_hgt, None, font, 'Center', 'Top')
-        temp_geo.append(txt_obj)
+    temp_geo.extend(DisplayLineSegment3D(LineSegment3D.from_line_segment2d(tl, z))
+                    for tl in psych_chart.temperature_lines)
+    temp_geo.extend(_labels_from_points(
+        psych_chart.temperature_labels, psych_chart.temperature_label_points, bp,
+        txt_hgt, font, 'Center', 'Top'))
     temp_axis = ContextGeometry('Temperature_Axis', temp_geo)
     temp_axis.display_name = 'Temperature Axis'
     vis_set.add_geometry(temp_axis)
@@ -110,59 +110,52 @@ def psychrometric_chart_to_vis_set(
     hr_txt = DisplayText3D(
         psych_chart.y_axis_text, hr_pl, txt_hgt * 1.5, None, font, 'Right', 'Top')
     hr_geo = [hr_txt]
-    for hl in psych_chart.hr_lines:
-        hl_geo = LineSegment3D.from_line_segment2d(hl, z)
-        hr_geo.append(DisplayLineSegment3D(hl_geo))
-    for txt, pt in zip(psych_chart.hr_labels, psych_chart.hr_label_points):
-        t_pln = Plane(o=Point3D(pt.x, pt.y, z))
-        txt_obj = DisplayText3D(txt, t_pln, txt_hgt, None, font, 'Left', 'Middle')
-        hr_geo.append(txt_obj)
+    hr_geo.extend(DisplayLineSegment3D(LineSegment3D.from_line_segment2d(hl, z))
+                  for hl in psych_chart.hr_lines)
+    hr_geo.extend(_labels_from_points(
+        psych_chart.hr_labels, psych_chart.hr_label_points, bp,
+        txt_hgt, font, 'Left', 'Middle'))
     hr_axis = ContextGeometry('Humidity_Axis', hr_geo)
     hr_axis.display_name = 'Humidity Axis'
     vis_set.add_geometry(hr_axis)
 
     # add the relative humidity lines
-    rh_geo = []
-    for rl in psych_chart.rh_lines:
-        rl_geo = Polyline3D.from_polyline2d(rl, bp)
-        rh_geo.append(DisplayPolyline3D(rl_geo))
-    for txt, pt in zip(psych_chart.rh_labels[:-1], psych_chart.rh_label_points[:-1]):
-        t_pln = Plane(o=Point3D(pt.x, pt.y, z))
-        txt_obj = DisplayText3D(txt, t_pln, txt_hgt * 0.8, None, font, 'Right', 'Middle')
-        rh_geo.append(txt_obj)
+    rh_geo = [DisplayPolyline3D(Polyline3D.from_polyline2d(rl, bp))
+              for rl in psych_chart.rh_lines]
+    rh_geo.extend(_labels_from_points(
+        psych_chart.rh_labels[:-1], psych_chart.rh_label_points[:-1], bp,
+        txt_hgt * 0.8, font, 'Right', 'Middle'))
     rh_axis = ContextGeometry('Relative_Humidity_Lines', rh_geo)
     rh_axis.display_name = 'Relative Humidity Lines'
     vis_set.add_geometry(rh_axis)
 
     # add enthalpy or wet bulb lines
     if plot_wet_bulb:
-        wb_geo = []
-        for wl in psych_chart.wb_lines:
-            wl_geo = LineSegment3D.from_line_segment2d(wl, z)
-            wb_geo.append(DisplayLineSegment3D(wl_geo, line_type='Dotted'))
-        for txt, pt in zip(psych_chart.wb_labels, psych_chart.wb_label_points):
-            t_pln = Plane(o=Point3D(pt.x, pt.y, z))
-            txt_obj = DisplayText3D(txt, t_pln, txt_hgt, None, font, 'Right', 'Middle')
-            wb_geo.append(txt_obj)
+        wb_geo = [DisplayLineSegment3D(LineSegment3D.from_line_segment2d(wl, z),
+                                       line_type='Dotted')
+                  for wl in psych_chart.wb_lines]
+        wb_geo.extend(_labels_from_points(
+            psych_chart.wb_labels, psych_chart.wb_label_points, bp,
+            txt_hgt, font, 'Right', 'Middle'))
         wb_axis = ContextGeometry('Wet_Bulb_Lines', wb_geo)
         wb_axis.display_name = 'Wet Bulb Lines'
         vis_set.add_geometry(wb_axis)
     else:
-        enth_geo = []
-        for wl in psych_chart.enthalpy_lines:
-            wl_geo = LineSegment3D.from_line_segment2d(wl, z)
-            enth_geo.append(DisplayLineSegment3D(wl_geo, line_type='Dotted'))
-        enth_pts = psych_chart.enthalpy_label_points
-        for txt, pt in zip(psych_chart.enthalpy_labels, enth_pts):
-            t_pln = Plane(o=Point3D(pt.x, pt.y, z))
-            txt_obj = DisplayText3D(txt, t_pln, txt_hgt, None, font, 'Right', 'Middle')
-            enth_geo.append(txt_obj)
+        enth_geo = [DisplayLineSegment3D(LineSegment3D.from_line_segment2d(wl, z),
+                                         line_type='Dotted')
+                    for wl in psych_chart.enthalpy_lines]
+        enth_geo.extend(_labels_from_points(
+            psych_chart.enthalpy_labels, psych_chart.enthalpy_label_points, bp,
+            txt_hgt, font, 'Right', 'Middle'))
         enth_axis = ContextGeometry('Enthalpy_Lines', enth_geo)
         enth_axis.display_name = 'Enthalpy Lines'
         vis_set.add_geometry(enth_axis)
 
     # add the analysis geometry
     # ensure 3D legend defaults are overridden to make the data readable
+    # (re-setting the chart's current values flags them as non-default so that
+    # they are not replaced by the defaults of the analysis geometry; the setters
+    # only validate the values so no further shortcut is warranted here)
     l_par = psych_chart.legend.legend_parameters.duplicate()
     l_par.base_plane = l_par.base_plane
     l_par.segment_height = l_par.segment_height
@@ -176,36 +169,44 @@ def psychrometric_chart_to_vis_set(
             l_pars = [legend_parameters] * len(data)
         else:  # assume it's a list that aligns with the data
             l_pars = legend_parameters
+        # assign each temperature and humidity value to a cell of the chart mesh
+        t_cat, rh_cat = psych_chart._t_category, psych_chart._rh_category
+        t_count, t_last, rh_last = len(t_cat), len(t_cat) - 1, len(rh_cat) - 1
+        min_t, max_t = psych_chart._min_temperature, psych_chart._max_temperature
+        chart_hours = []  # pairs of data index and cell index for values on the chart
+        counts = [0] * (t_count * len(rh_cat))
+        t_rh_values = zip(psych_chart._t_values, psych_chart._rh_values)
+        for i, (t, rh) in enumerate(t_rh_values):
+            if t < min_t or t > max_t:
+                continue  # temperature value does not currently fit on the chart
+            cell_i = min(bisect_right(rh_cat, rh), rh_last) * t_count + \
+                min(bisect_right(t_cat, t), t_last)
+            chart_hours.append((i, cell_i))
+            counts[cell_i] += 1
+        filled = [i for i, cnt in enumerate(counts) if cnt != 0]  # cells with data
+        # get the legend properties that each data set inherits from the chart
+        base_pl, seg_hgt, seg_wdth = \
+            l_par.base_plane, l_par.segment_height, l_par.segment_width
         for dat, lp in zip(data, l_pars):
             # process the legend parameters
             lp = lp.duplicate()
             if lp.is_base_plane_default:
-                lp.base_plane = l_par.base_plane
+                lp.base_plane = base_pl
             if lp.is_segment_height_default:
-                lp.segment_height = l_par.segment_height
+                lp.segment_height = seg_hgt
             if lp.is_segment_width_default:
-                lp.segment_width = l_par.segment_width
+                lp.segment_width = seg_wdth
             # check to be sure the data collection aligns
             d_vals = dat.values
             assert len(d_vals) == psych_chart._calc_length, \
                 'Number of data collection values ' \
                 'must match those of the psychrometric chart temperature and humidity.'
-            # create a matrix with a tally of the hours for all the data
-            base_mtx = [[[] for val in psych_chart._t_category]
-                        for rh in psych_chart._rh_category]
-            for t, rh, v in zip(psych_chart._t_values, psych_chart._rh_values, d_vals):
-                if t < psych_chart._min_temperature or t > psych_chart._max_temperature:
-                    continue  # temperature value does not currently fit on the chart
-                for y, rh_cat in enumerate(psych_chart._rh_category):
-                    if rh < rh_cat:
-                        break
-                for x, t_cat in enumerate(psych_chart._t_category):
-                    if t < t_cat:
-                        break
-                base_mtx[y][x].append(v)
+            # tally the sum of the data in each cell of the chart mesh
+            sums = [0] * len(counts)
+            for i, cell_i in chart_hours:
+                sums[cell_i] += d_vals[i]
             # compute average values
-            avg_values = [sum(val_list) / len(val_list) for rh_l in base_mtx
-                          for val_list in rh_l if len(val_list) != 0]
+            avg_values = [sums[i] / counts[i] for i in filled]
             hd = dat.header
             vd = VisualizationData(avg_values, lp, hd.data_type, hd.unit)
             vis_data.append(vd)
@@ -229,3 +230,22 @@ def _plane_from_point(point_2d, z, align_vec=Vector3D(1, 0, 0)):
         align_vec: A Vector3D to serve as the X-Axis of the plane.
     """
     return Plane(o=Point3D(point_2d.x, point_2d.y, z), x=align_vec)
+
+
+def _labels_from_points(labels, points, base_plane, text_height, font,
+                        horizontal_alignment, vertical_alignment):
+    """Get a list of DisplayText3D from text labels and the Point2Ds where they go.
+
+    Args:
+        labels: A list of text strings for the labels.
+        points: A list of Point2D for the location of each label.
+        base_plane: A Plane with the orientation and Z value of the labels.
+        text_height: A number for the height of the text.
+        font: Text for the font of the labels.
+        horizontal_alignment: Text for the horizontal alignment of the labels.
+        vertical_alignment: Text for the vertical alignment of the labels.
+    """
+    z = base_plane.o.z
+    return [DisplayText3D(txt, Plane(o=Point3D(pt.x, pt.y, z)), text_height, None,
+                          font, horizontal_alignment, vertical_alignment)
+            for txt, pt in zip(labels, points)]
@@ -1,4 +1,6 @@
 """Method to draw a RadiationDome as a VisualizationSet."""
+from itertools import chain
+
 from ladybug_geometry.geometry3d import Vector3D, Point3D, Plane
 
 from ladybug_display.geometry3d import DisplayPoint3D, DisplayText3D
@@ -42,23 +44,23 @@ def radiation_dome_to_vis_set(radiation_dome, show_components=False, include_tit
         mesh, compass_obj, dome_graphic, title_txt = radiation_dome.draw()
         compass, title = _translate_context(
             compass_obj, dome_graphic, title_txt, cent_pt, proj, az)
-        mesh, title = [mesh], [title]
+        mesh, title = (mesh,), (title,)
         mesh_values = radiation_dome.total_values
     else:  # create domes for total, direct and diffuse
         # loop through the 3 radiation types and produce a dome
-        mesh, compass, title, mesh_values = [], [], [], []
+        mesh, compass, title = [], [], []
         rad_types = ('total', 'direct', 'diffuse')
-        for dome_i in range(3):
+        for dome_i, rad_type in enumerate(rad_types):
             c_pt = Point3D(cent_pt.x + radius * 3 * dome_i, cent_pt.y, cent_pt.z)
             dome_mesh, dome_compass, dome_graphic, dome_title = \
-                radiation_dome.draw(rad_types[dome_i], c_pt)
+                radiation_dome.draw(rad_type, c_pt)
             compass_con, title_con = _translate_context(
                 dome_compass, dome_graphic, dome_title, cent_pt, proj, az)
             mesh.append(dome_mesh)
             compass.extend(compass_con)
             title.append(title_con)
-            mesh_values.extend(
-                getattr(radiation_dome, '{}_values'.format(rad_types[dome_i])))
+        mesh_values = list(chain.from_iterable(
+            getattr(radiation_dome, '{}_values'.format(rt)) for rt in rad_types))
 
     # create the visualization set object
     vis_set = VisualizationSet('RadiationDome', ())
@@ -111,18 +113,13 @@ def _translate_context(compass, graphic, title_txt, cent_pt, projection, az_coun
         dome_compass: A ContextGeometry for the dome compass.
         dome_title: DisplayText3D for the title for the dome.
     """
-    dome_angles = list(range(0, 360, int(360 / az_count)))
-    start, stop, step, dome_angles = 0, 360, 360 / az_count, []
-    while start < stop:
-        dome_angles.append(start)
-        start += step
-    dome_angles = [int(n) for n in dome_angles]
+    dome_angles = [int(360 * i / az_count) for i in range(az_count)]
     if len(dome_angles) > 36:
         dome_angles = dome_angles[::2]
+    font = graphic.legend_parameters.font
     dome_compass = compass.to_vis_set(
-        cent_pt.z, dome_angles, projection, graphic.legend_parameters.font)[0]
+        cent_pt.z, dome_angles, projection, font)[0]
     dome_title = DisplayText3D(
         title_txt, graphic.lower_title_location,
-        graphic.legend_parameters.text_height, None,
-        graphic.legend_parameters.font, 'Left', 'Top')
+        graphic.legend_parameters.text_height, None, font, 'Left', 'Top')
     return dome_compass, dome_title
@@ -1,4 +1,6 @@
 """Method to draw a RadiationRose as a VisualizationSet."""
+from itertools import chain
+
 from ladybug_geometry.geometry3d import Point3D
 
 from ladybug_display.geometry3d import DisplayLineSegment3D, DisplayText3D
@@ -49,24 +51,24 @@ def radiation_rose_to_vis_set(
             radiation_rose.draw(max_rad=max_rad)
         compass, orient_lines, title = _translate_context(
             compass_obj, orient, rose_graphic, title_txt, cent_pt, d_count)
-        mesh, title = [mesh], [title]
+        mesh, title = (mesh,), (title,)
         mesh_values = radiation_rose.total_values
     else:  # create roses for total, direct and diffuse
         # loop through the 3 radiation types and produce a rose
-        mesh, orient_lines, compass, title, mesh_values = [], [], [], [], []
+        mesh, orient_lines, compass, title = [], [], [], []
         rad_types = ('total', 'direct', 'diffuse')
-        for rose_i in range(3):
+        for rose_i, rad_type in enumerate(rad_types):
             c_pt = Point3D(cent_pt.x + radius * 3 * rose_i, cent_pt.y, cent_pt.z)
             rose_mesh, orient, rose_compass, rose_graphic, rose_title = \
-                radiation_rose.draw(rad_types[rose_i], c_pt, max_rad=max_rad)
+                radiation_rose.draw(rad_type, c_pt, max_rad=max_rad)
             compass_con, orient_con, title_con = _translate_context(
                 rose_compass, orient, rose_graphic, rose_title, cent_pt, d_count)
             mesh.append(rose_mesh)
             orient_lines.extend(orient_con)
             compass.extend(compass_con)
             title.append(title_con)
-            mesh_values.extend(
-                getattr(radiation_rose, '{}_values'.format(rad_types[rose_i])))
+        mesh_values = list(chain.from_iterable(
+            getattr(radiation_rose, '{}_values'.format(rt)) for rt in rad_types))
 
     # create the visualization set object
     vis_set = VisualizationSet('RadiationRose', ())
@@ -112,20 +114,15 @@ def _translate_context(compass, dir_lines, graphic, title_txt, cent_pt, dir_coun
         rose_lines: DisplayLineSegment3D for the directions of the rose.
         rose_title: DisplayText3D for the title for the rose.
     """
-    rose_angles = list(range(0, 360, int(360 / dir_count)))
-    start, stop, step, rose_angles = 0, 360, 360 / dir_count, []
-    while start < stop:
-        rose_angles.append(start)
-        start += step
-    rose_angles = [int(n) for n in rose_angles]
+    rose_angles = [int(360 * i / dir_count) for i in range(dir_count)]
     if len(rose_angles) > 36:
         rose_angles = rose_angles[::2]
+    font = graphic.legend_parameters.font
     rose_compass = compass.to_vis_set(
-        cent_pt.z, rose_angles, None, graphic.legend_parameters.font)[0]
+        cent_pt.z, rose_angles, None, font)[0]
     rose_lines = [DisplayLineSegment3D(lin, line_width=1, line_type='Dotted')
                   for lin in dir_lines]
     rose_title = DisplayText3D(
         title_txt, graphic.lower_title_location,
-        graphic.legend_parameters.text_height, None,
-        graphic.legend_parameters.font, 'Left', 'Top')
+        graphic.legend_parameters.text_height, None, font, 'Left', 'Top')
     return rose_compass, rose_lines, rose_title
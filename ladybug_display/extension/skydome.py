@@ -1,4 +1,6 @@
 """Method to draw a SkyDome as a VisualizationSet."""
+from itertools import chain
+
 from ladybug_geometry.geometry3d.pointvector import Point3D
 
 from ladybug_display.geometry3d import DisplayText3D
@@ -36,21 +38,22 @@ def sky_dome_to_vis_set(sky_dome, show_components=False, include_title=True):
         mesh, compass_obj, dome_graphic, title_txt, mesh_values = sky_dome.draw()
         compass, title = _translate_context(
             compass_obj, dome_graphic, title_txt, cent_pt, proj)
-        mesh, title = [mesh], [title]
+        mesh, title = (mesh,), (title,)
     else:  # create domes for total, direct and diffuse
         # loop through the 3 radiation types and produce a dome
-        mesh, compass, title, mesh_values = [], [], [], []
+        mesh, compass, title, all_values = [], [], [], []
         rad_types = ('total', 'direct', 'diffuse')
-        for dome_i in range(3):
+        for dome_i, rad_type in enumerate(rad_types):
             c_pt = Point3D(cent_pt.x + radius * 3 * dome_i, cent_pt.y, cent_pt.z)
             dome_mesh, dome_compass, dome_graphic, dome_title, dome_values = \
-                sky_dome.draw(rad_types[dome_i], c_pt)
+                sky_dome.draw(rad_type, c_pt)
             compass_con, title_con = _translate_context(
                 dome_compass, dome_graphic, dome_title, cent_pt, proj)
             mesh.append(dome_mesh)
             compass.extend(compass_con)
             title.append(title_con)
-            mesh_values.extend(dome_values)
+            all_values.append(dome_values)
+        mesh_values = list(chain.from_iterable(all_values))
 
     # create the visualization set object
     vis_set = VisualizationSet('SkyDome', ())
@@ -91,10 +94,10 @@ def _translate_context(compass, graphic, title_txt, cent_pt, projection):
         dome_compass: A ContextGeometry for the dome compass.
         dome_title: DisplayText3D for the title for the dome.
     """
+    font = graphic.legend_parameters.font
     dome_compass = compass.to_vis_set(
-        cent_pt.z, None, projection, graphic.legend_parameters.font)[0]
+        cent_pt.z, None, projection, font)[0]
     dome_title = DisplayText3D(
         title_txt, graphic.lower_title_location,
-        graphic.legend_parameters.text_height, None,
-        graphic.legend_parameters.font, 'Left', 'Top')
+        graphic.legend_parameters.text_height, None, font, 'Left', 'Top')
     return dome_compass, dome_title
@@ -0,0 +1,45 @@
+"""Utilities shared by the methods that draw ladybug-radiance studies."""
+from ladybug_geometry.bounding import bounding_box
+from ladybug_geometry.geometry3d import Mesh3D
+from ladybug.color import Color
+from ladybug.graphic import GraphicContainer
+
+from ladybug_display.geometry3d import DisplayText3D, DisplayMesh3D, DisplayFace3D
+from ladybug_display.visualization import ContextGeometry
+
+
+def _study_title(study, values, legend_parameters, data_type, unit, title):
+    """Get a ContextGeometry for the title of a study.
+
+    Args:
+        study: A Ladybug-Radiance study object with a study_mesh and context_geometry.
+        values: A list of numbers for the results of the study.
+        legend_parameters: The LegendParameters used to display the study results.
+        data_type: A ladybug DataType object for the study results.
+        unit: Text for the units of the study results.
+        title: Text for the title of the study.
+    """
+    all_geo = (study.study_mesh,) + study.context_geometry
+    min_pt, max_pt = bounding_box(all_geo)
+    graphic = GraphicContainer(
+        values, min_pt, max_pt, legend_parameters, data_type, unit)
+    l_par = graphic.legend_parameters
+    study_title = DisplayText3D(
+        title, graphic.lower_title_location, l_par.text_height, None,
+        l_par.font, 'Left', 'Top')
+    return ContextGeometry('Title', [study_title])
+
+
+def _study_context(study):
+    """Get a ContextGeometry for the context geometry used in a study.
+
+    Args:
+        study: A Ladybug-Radiance study object with context_geometry.
+    """
+    con_color = Color(125, 125, 125, 125)
+    con_geos = [DisplayMesh3D(geo, con_color) if isinstance(geo, Mesh3D)
+                else DisplayFace3D(geo, con_color)  # it's a Face3D
+                for geo in study.context_geometry]
+    context_geo = ContextGeometry('Context_Geometry', con_geos)
+    context_geo.display_name = 'Context Geometry'
+    return context_geo
@@ -1,14 +1,11 @@
 """Method to draw a RadiationDome as a VisualizationSet."""
-from ladybug_geometry.bounding import bounding_box
-from ladybug_geometry.geometry3d import Mesh3D
-from ladybug.color import Colorset, Color
+from ladybug.color import Colorset
 from ladybug.legend import LegendParameters
-from ladybug.graphic import GraphicContainer
 from ladybug.datatype.time import Time
 
-from ladybug_display.geometry3d import DisplayText3D, DisplayMesh3D, DisplayFace3D
 from ladybug_display.visualization import VisualizationSet, AnalysisGeometry, \
-    VisualizationData, ContextGeometry
+    VisualizationData
+from ._common import _study_title, _study_context
 
 
 def direct_sun_study_to_vis_set(
@@ -64,28 +61,12 @@ def direct_sun_study_to_vis_set(
 
     # create the ContextGeometry for the title
     if include_title:
-        all_geo = (direct_sun_study.study_mesh,) + direct_sun_study.context_geometry
-        min_pt, max_pt = bounding_box(all_geo)
-        graphic = GraphicContainer(
-            sun_data, min_pt, max_pt, l_par, d_type, unit)
-        study_title = DisplayText3D(
-            'Direct Sun Hours', graphic.lower_title_location,
-            graphic.legend_parameters.text_height, None,
-            graphic.legend_parameters.font, 'Left', 'Top')
-        title_geo = ContextGeometry('Title', [study_title])
+        title_geo = _study_title(
+            direct_sun_study, sun_data, l_par, d_type, unit, 'Direct Sun Hours')
         vis_set.add_geometry(title_geo)
 
     # create the ContextGeometry for the context
     if include_context:
-        con_color = Color(125, 125, 125, 125)
-        con_geos = []
-        for geo in direct_sun_study.context_geometry:
-            if isinstance(geo, Mesh3D):
-                con_geos.append(DisplayMesh3D(geo, con_color))
-            else:  # it's a Face3D
-                con_geos.append(DisplayFace3D(geo, con_color))
-        context_geo = ContextGeometry('Context_Geometry', con_geos)
-        context_geo.display_name = 'Context Geometry'
-        vis_set.add_geometry(context_geo)
+        vis_set.add_geometry(_study_context(direct_sun_study))
 
     return vis_set
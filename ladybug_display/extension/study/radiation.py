@@ -1,15 +1,12 @@
 """Method to draw a RadiationDome as a VisualizationSet."""
-from ladybug_geometry.bounding import bounding_box
-from ladybug_geometry.geometry3d import Mesh3D
-from ladybug.color import Colorset, Color
+from ladybug.color import Colorset
 from ladybug.legend import LegendParameters
-from ladybug.graphic import GraphicContainer
 from ladybug.datatype.energyintensity import Radiation
 from ladybug.datatype.energyflux import Irradiance
 
-from ladybug_display.geometry3d import DisplayText3D, DisplayMesh3D, DisplayFace3D
 from ladybug_display.visualization import VisualizationSet, AnalysisGeometry, \
-    VisualizationData, ContextGeometry
+    VisualizationData
+from ._common import _study_title, _study_context
 
 
 def radiation_study_to_vis_set(
@@ -60,12 +57,14 @@ def radiation_study_to_vis_set(
     else:
         l_par = LegendParameters()
     if radiation_study.is_benefit:
-        if l_par.min is None:
-            l_par.min = min((min(rad_data), -max(rad_data)))
-        if l_par.max is None:
-            l_par.max = max((-min(rad_data), max(rad_data)))
+        if l_par.min is None or l_par.max is None:
+            min_rad, max_rad = min(rad_data), max(rad_data)
+            if l_par.min is None:
+                l_par.min = min((min_rad, -max_rad))
+            if l_par.max is None:
+                l_par.max = max((-min_rad, max_rad))
         if l_par.are_colors_default:
-            l_par.colors = reversed(Colorset.benefit_harm())
+            l_par.colors = tuple(reversed(Colorset.benefit_harm()))
     else:
         if l_par.min is None:
             l_par.min = 0
@@ -86,28 +85,11 @@ def radiation_study_to_vis_set(
 
     # create the ContextGeometry for the title
     if include_title:
-        all_geo = (radiation_study.study_mesh,) + radiation_study.context_geometry
-        min_pt, max_pt = bounding_box(all_geo)
-        graphic = GraphicContainer(
-            rad_data, min_pt, max_pt, l_par, d_type, unit)
-        study_title = DisplayText3D(
-            title, graphic.lower_title_location,
-            graphic.legend_parameters.text_height, None,
-            graphic.legend_parameters.font, 'Left', 'Top')
-        title_geo = ContextGeometry('Title', [study_title])
+        title_geo = _study_title(radiation_study, rad_data, l_par, d_type, unit, title)
         vis_set.add_geometry(title_geo)
 
     # create the ContextGeometry for the context
     if include_context:
-        con_color = Color(125, 125, 125, 125)
-        con_geos = []
-        for geo in radiation_study.context_geometry:
-            if isinstance(geo, Mesh3D):
-                con_geos.append(DisplayMesh3D(geo, con_color))
-            else:  # it's a Face3D
-                con_geos.append(DisplayFace3D(geo, con_color))
-        context_geo = ContextGeometry('Context_Geometry', con_geos)
-        context_geo.display_name = 'Context Geometry'
-        vis_set.add_geometry(context_geo)
+        vis_set.add_geometry(_study_context(radiation_study))
 
     return vis_set
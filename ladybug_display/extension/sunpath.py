@@ -11,6 +11,10 @@ from ..visualization import VisualizationSet, \
     ContextGeometry, AnalysisGeometry, VisualizationData
 from .compass import compass_to_vis_set
 
+# line widths and types for each of the 12 monthly day arcs of the sunpath
+_MONTH_LINE_WIDTHS = (1, 1, 1, 1, 1, 2) * 2
+_MONTH_LINE_TYPES = ('Continuous',) * 6 + ('Dashed',) * 6
+
 
 def sunpath_to_vis_set(
         sunpath, hoys=None, data=None, legend_parameters=None,
@@ -74,9 +78,9 @@ def sunpath_to_vis_set(
     vis_set.display_name = 'Sunpath'
 
     # add the compass to the bottom of the path
-    center_2d = Point2D(center_point.x, center_point.y)
-    compass = Compass(radius, center_2d, sunpath.north_angle)
-    compass_vis = compass_to_vis_set(compass, z=center_point.z, projection=projection)
+    center_pt, z = Point2D(center_point.x, center_point.y), center_point.z
+    compass = Compass(radius, center_pt, sunpath.north_angle)
+    compass_vis = compass_to_vis_set(compass, z=z, projection=projection)
     vis_set.add_geometry(compass_vis[0])
 
     # create a intersection of the input hoys and the data hoys (if provided)
@@ -85,84 +89,80 @@ def sunpath_to_vis_set(
         assert all_aligned, 'All collections input to data must be aligned for ' \
             'each Sunpath.\nGrafting the data and supplying multiple grafted ' \
             '_center_pt_ can be used to view each data on its own path.'
-        data_hoys = set(dt.hoy for dt in data[0].datetimes)
-        hoys = list(data_hoys.intersection(set(hoys)))
+        hoy_set = set(hoys)
+        hoys = [dt.hoy for dt in data[0].datetimes if dt.hoy in hoy_set]
 
-    # get the relevant sus and datetimes
-    suns, datetimes, moys = [], [], []
+    # get the relevant suns
+    suns = []
     if hoys is not None and len(hoys) > 0:
+        hoy_suns = {}  # avoid recalculating the sun for any duplicated hoys
         for hoy in hoys:
-            sun = sunpath.calculate_sun_from_hoy(hoy, solar_time)
+            sun = hoy_suns.get(hoy)
+            if sun is None:
+                sun = hoy_suns[hoy] = sunpath.calculate_sun_from_hoy(hoy, solar_time)
             if sun.is_during_day:
                 suns.append(sun)
-                datetimes.append(sun.datetime)
-                moys.append(sun.datetime.moy)
 
     # add the daily arcs and analemmas to the visualization set
     original_dls = sunpath.daylight_saving_period
     sunpath.daylight_saving_period = None  # set here so analemmas aren't messed up
-    center_pt, z = Point2D(center_point.x, center_point.y), center_point.z
-    if not daily:
-        if projection is None:
-            # draw arcs and analemmas in 3D
-            ana_plin_1 = sunpath.hourly_analemma_polyline3d(
-                center_point, radius, True, solar_time, 1, 6, 4)
-            ana_plin_2 = sunpath.hourly_analemma_polyline3d(
-                center_point, radius, True, solar_time, 7, 12, 4)
-            analemma = [DisplayPolyline3D(pl, line_width=1) for pl in ana_plin_1] + \
-                [DisplayPolyline3D(pl, line_width=1, line_type='Dashed')
-                 for pl in ana_plin_2]
-            daily_arc = sunpath.monthly_day_arc3d(center_point, radius)
-            daily = []
-            for i, arc in enumerate(daily_arc):
-                lw = 2 if (i + 1) % 6 == 0 else 1
-                lt = 'Continuous' if i <= 5 else 'Dashed'
-                daily.append(DisplayArc3D(arc, line_width=lw, line_type=lt))
-        else:
-            # draw arcs and analemmas in the requested projection
+    try:
+        if projection is not None:  # base plane for all of the projected geometry
             bp = Plane(o=Point3D(0, 0, z))
-            ana_plin_1 = sunpath.hourly_analemma_polyline2d(
-                projection, center_point, radius, True, solar_time, 1, 6, 4)
-            ana_plin_2 = sunpath.hourly_analemma_polyline2d(
-                projection, center_point, radius, True, solar_time, 7, 12, 4)
-            analemma = \
-                [DisplayPolyline3D(Polyline3D.from_polyline2d(p, bp), line_width=1)
-                 for p in ana_plin_1] + \
-                [DisplayPolyline3D(
+        if not daily:
+            if projection is None:
+                # draw arcs and analemmas in 3D
+                ana_plin_1 = sunpath.hourly_analemma_polyline3d(
+                    center_point, radius, True, solar_time, 1, 6, 4)
+                ana_plin_2 = sunpath.hourly_analemma_polyline3d(
+                    center_point, radius, True, solar_time, 7, 12, 4)
+                analemma = [DisplayPolyline3D(pl, line_width=1) for pl in ana_plin_1]
+                analemma.extend(DisplayPolyline3D(pl, line_width=1, line_type='Dashed')
+                                for pl in ana_plin_2)
+                daily_arc = sunpath.monthly_day_arc3d(center_point, radius)
+                daily = [DisplayArc3D(arc, line_width=lw, line_type=lt) for arc, lw, lt
+                         in zip(daily_arc, _MONTH_LINE_WIDTHS, _MONTH_LINE_TYPES)]
+            else:
+                # draw arcs and analemmas in the requested projection
+                ana_plin_1 = sunpath.hourly_analemma_polyline2d(
+                    projection, center_point, radius, True, solar_time, 1, 6, 4)
+                ana_plin_2 = sunpath.hourly_analemma_polyline2d(
+                    projection, center_point, radius, True, solar_time, 7, 12, 4)
+                analemma = \
+                    [DisplayPolyline3D(Polyline3D.from_polyline2d(p, bp), line_width=1)
+                     for p in ana_plin_1]
+                analemma.extend(DisplayPolyline3D(
                     Polyline3D.from_polyline2d(p, bp), line_width=1, line_type='Dashed')
-                 for p in ana_plin_2]
-            daily_arc = sunpath.monthly_day_polyline2d(
-                projection, center_point, radius, divisions=30)
-            daily = []
-            for i, arc in enumerate(daily_arc):
-                lw = 2 if (i + 1) % 6 == 0 else 1
-                lt = 'Continuous' if i <= 5 else 'Dashed'
-                pline = Polyline3D.from_polyline2d(arc, bp)
-                daily.append(DisplayPolyline3D(pline, line_width=lw, line_type=lt))
-        analemma_geo = ContextGeometry('Analemmas', analemma)
-        vis_set.add_geometry(analemma_geo)
-    else:
-        # just draw daily arcs without the analemmas
-        doys = set(dt.doy for dt in datetimes)
-        dates = [Date.from_doy(doy) for doy in doys]
-        if projection is None:
-            daily = []
-            for dat in dates:
-                d_arc = sunpath.day_arc3d(dat.month, dat.day, center_point, radius)
-                daily.append(DisplayArc3D(d_arc, line_width=1))
+                    for p in ana_plin_2)
+                daily_arc = sunpath.monthly_day_polyline2d(
+                    projection, center_point, radius, divisions=30)
+                daily = [DisplayPolyline3D(Polyline3D.from_polyline2d(arc, bp),
+                                           line_width=lw, line_type=lt) for arc, lw, lt
+                         in zip(daily_arc, _MONTH_LINE_WIDTHS, _MONTH_LINE_TYPES)]
+            analemma_geo = ContextGeometry('Analemmas', analemma)
+            vis_set.add_geometry(analemma_geo)
         else:
-            bp = Plane(o=Point3D(0, 0, z))
-            daily = []
-            for dat in dates:
-                d_arc = sunpath.day_polyline2d(
-                    dat.month, dat.day, projection, center_pt, radius, divisions=30)
-                daily.append(DisplayPolyline3D(
-                    Polyline3D.from_polyline2d(d_arc, bp), line_width=1))
-    if len(daily) != 0:
-        daily_geo = ContextGeometry('Daily_Arcs', daily)
-        daily_geo.display_name = 'Daily Arcs'
-        vis_set.add_geometry(daily_geo)
-    sunpath.daylight_saving_period = original_dls  # put back to avoid mutation
+            # just draw daily arcs without the analemmas
+            doys = sorted(set(sun.datetime.doy for sun in suns))
+            dates = [Date.from_doy(doy) for doy in doys]
+            if projection is None:
+                daily = []
+                for dat in dates:
+                    d_arc = sunpath.day_arc3d(dat.month, dat.day, center_point, radius)
+                    daily.append(DisplayArc3D(d_arc, line_width=1))
+            else:
+                daily = []
+                for dat in dates:
+                    d_arc = sunpath.day_polyline2d(
+                        dat.month, dat.day, projection, center_pt, radius, divisions=30)
+                    daily.append(DisplayPolyline3D(
+                        Polyline3D.from_polyline2d(d_arc, bp), line_width=1))
+        if len(daily) != 0:
+            daily_geo = ContextGeometry('Daily_Arcs', daily)
+            daily_geo.display_name = 'Daily Arcs'
+            vis_set.add_geometry(daily_geo)
+    finally:
+        sunpath.daylight_saving_period = original_dls  # put back to avoid mutation
 
     # plot the sun positions as points on the sunpath
     if hoys is not None and len(hoys) > 0:
@@ -170,29 +170,33 @@ def sunpath_to_vis_set(
         if projection is None:
             sun_pts = [sun.position_3d(center_point, radius) for sun in suns]
         else:
-            sun_pts = []
-            for sun in suns:
-                pt2d = sun.position_2d(projection, center_point, radius)
-                sun_pts.append(Point3D.from_point2d(pt2d, z))
-        if sun_spheres:
-            sun_pts = [Sphere(pt, radius / 30) for pt in sun_pts]
+            sun_pts = [Point3D.from_point2d(
+                sun.position_2d(projection, center_point, radius), z) for sun in suns]
+        sun_rad = radius / 30
         # plot the sun positions as either context or analysis geometry
         if data is not None and len(data) > 0:
+            if sun_spheres:
+                sun_pts = [Sphere(pt, sun_rad) for pt in sun_pts]
             # plot points as context or analysis geometry (if data is connected)
             if isinstance(legend_parameters, LegendParameters):
                 legend_parameters = [legend_parameters] * len(data)
+            # get the indices of the sun-up hours, which are shared by all aligned data
+            moy_set = set(sun.datetime.moy for sun in suns)
+            sun_up_i = [j for j, dt in enumerate(data[0].datetimes) if dt.moy in moy_set]
             all_data = []
             for i, dat_c in enumerate(data):
                 l_par = legend_parameters[i] if legend_parameters is not None else None
-                n_data = dat_c.filter_by_moys(moys)  # filter data by sun-up hours
+                d_vals = dat_c.values
+                sun_up_vals = [d_vals[j] for j in sun_up_i]  # filter by sun-up hours
                 v_data = VisualizationData(
-                    n_data.values, l_par, dat_c.header.data_type, dat_c.header.unit)
+                    sun_up_vals, l_par, dat_c.header.data_type, dat_c.header.unit)
                 all_data.append(v_data)
             sun_geo = AnalysisGeometry('Sun_Positions', sun_pts, all_data)
         else:  # otherwise, plot the suns as context geometry
             orange = Color(255, 165, 0)
             if sun_spheres:
-                dis_pts = [DisplaySphere(pt, color=orange) for pt in sun_pts]
+                dis_pts = [DisplaySphere(Sphere(pt, sun_rad), color=orange)
+                           for pt in sun_pts]
             else:
                 dis_pts = [DisplayPoint3D(pt, color=orange, radius=5) for pt in sun_pts]
             sun_geo = ContextGeometry('Sun_Positions', dis_pts)
@@ -76,7 +76,7 @@ def view_sphere_to_vis_set(
 
      """
     # get the view method from the view type
-    center_types = ('HorizontalRadial', 'Horizontal30DegreeOffset')
+    is_center = view_type in ('HorizontalRadial', 'Horizontal30DegreeOffset')
     if view_type == 'HorizontalRadial':
         view_method = view_sphere.horizontal_circle_view_mesh
     elif view_type == 'Horizontal30DegreeOffset':
@@ -105,18 +105,18 @@ def view_sphere_to_vis_set(
     # if a context_intersect_dist is supplied, adjust the mesh based on the distance
     if context_intersect_dist is not None:
         results = context_intersect_dist
-        move_vecs = [vec * -(radius - dist) for vec, dist, in zip(view_vecs, results)]
-        new_verts = [center_point] if view_type in center_types else []
-        iter_verts = study_mesh.vertices[1:] if view_type in center_types \
-            else study_mesh.vertices
-        for pt, mv in zip(iter_verts, move_vecs):
-            new_verts.append(pt.move(mv))
+        new_verts = [center_point] if is_center else []
+        iter_verts = study_mesh.vertices[1:] if is_center else study_mesh.vertices
+        for pt, vec, dist in zip(iter_verts, view_vecs, results):
+            mv = dist - radius  # distance to move the vertex along the view vector
+            new_verts.append(
+                Point3D(pt.x + vec.x * mv, pt.y + vec.y * mv, pt.z + vec.z * mv))
         study_mesh = Mesh3D(new_verts, study_mesh.faces)
     else:
         results = [radius] * len(view_vecs)
 
     # add a value at the start to align with the vertices
-    if view_type in center_types:
+    if is_center:
         avg_val = sum(results) / len(results)
         results.insert(0, avg_val)
     
@@ -135,12 +135,10 @@ def view_sphere_to_vis_set(
     # add a context geometry for the view rays if requested
     if draw_view_rays:
         mesh_geo.display_mode = 'SurfaceWithEdges'
-        base_pts = study_mesh.vertices[1:] if view_type in center_types \
-            else study_mesh.vertices
+        base_pts = study_mesh.vertices[1:] if is_center else study_mesh.vertices
         ray_len = radius / 10
-        rays = []
-        for pt, vec in zip(base_pts, view_vecs):
-            rays.append(DisplayRay3D(Ray3D(pt, vec * ray_len)))
+        rays = [DisplayRay3D(Ray3D(pt, vec * ray_len))
+                for pt, vec in zip(base_pts, view_vecs)]
         ray_geo = ContextGeometry('View_Rays', rays)
         ray_geo.display_name = 'View Rays'
         vis_set.add_geometry(ray_geo)
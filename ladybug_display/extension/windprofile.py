@@ -67,11 +67,6 @@ def wind_profile_to_vis_set(
         -   Height_Axis -- A ContextGeometry of line segments and text objects
             that mark the Y axis, which relates to the the height above the ground.
     """
-    # establish the VisualizationSet object
-    vis_set = VisualizationSet(
-        'WindProfile_{}'.format(int(meteorological_wind_speed)), ())
-    vis_set.display_name = 'Wind Profile'
-
     # shorten the names of the inputs to make them easier to work with
     met_ws = meteorological_wind_speed
     bp, len_d, height_d = base_point, vector_length_dimension, vector_height_dimension
@@ -92,14 +87,11 @@ def wind_profile_to_vis_set(
     if legend_par.is_segment_height_default:
         s_count = legend_par.segment_count
         denom = s_count if s_count >= 8 else 8
+        dist_x, dist_y = max_pt.x - bp.x, max_pt.y - bp.y  # Point3D coords are floats
         if legend_par.vertical:
-            seg_height = float((max_pt.y - bp.y) / denom)
-            if seg_height == 0:
-                seg_height = float((max_pt.x - bp.x) / denom)
+            seg_height = dist_y / denom or dist_x / denom
         else:
-            seg_height = float((max_pt.x - bp.x) / (denom * 2))
-            if seg_height == 0:
-                seg_height = float((max_pt.y - bp.y) / denom)
+            seg_height = dist_x / (denom * 2) or dist_y / denom
         legend_par.properties_3d.segment_height = seg_height
     # set the default segment_width
     if legend_par.is_segment_width_default:
@@ -117,46 +109,44 @@ def wind_profile_to_vis_set(
     # create an AnalysisGeometry for the colored arrows
     vis_data = VisualizationData(wind_speeds, legend_par, WindSpeed(), 'm/s')
     a_geo = AnalysisGeometry('Arrows', mesh_arrows, [vis_data])
-    vis_set.add_geometry(a_geo)
 
     # create a ContextGeometry for the profile line
     pl, _, _ = profile.profile_polyline3d(
         met_ws, max_height, 0.1, direction, bp, len_d, scale_factor)
     dis_profile_line = DisplayPolyline3D(pl, line_width=1)
     profile_geo = ContextGeometry('Profile', [dis_profile_line])
-    vis_set.add_geometry(profile_geo)
 
     # create a ContextGeometry for the speed axis
-    txt_h = legend_par.text_height
+    txt_h, font = legend_par.text_height, legend_par.font
     axis_line, axis_arrow, axis_ticks, text_planes, text = \
         profile.speed_axis(max_speed, direction, bp, len_d, scale_factor, txt_h)
     speed_axis = [DisplayLineSegment3D(axis_line), DisplayMesh3D(axis_arrow)]
-    for tic in axis_ticks:
-        speed_axis.append(DisplayLineSegment3D(tic))
-    for i, (pl, txt) in enumerate(zip(text_planes, text)):
-        txt_i_h = txt_h if i != len(text) - 1 else txt_h * 1.25
-        txt_obj = DisplayText3D(txt, pl, txt_i_h, None, legend_par.font, 'Center', 'Top')
-        speed_axis.append(txt_obj)
+    speed_axis.extend(DisplayLineSegment3D(tic) for tic in axis_ticks)
+    speed_axis.extend(
+        DisplayText3D(txt, pl, txt_h, None, font, 'Center', 'Top')
+        for pl, txt in zip(text_planes[:-1], text[:-1]))
+    speed_axis.append(DisplayText3D(  # the last label is the axis title
+        text[-1], text_planes[-1], txt_h * 1.25, None, font, 'Center', 'Top'))
     speed_axis_geo = ContextGeometry('Speed_Axis', speed_axis)
     speed_axis_geo.display_name = 'Speed Axis'
-    vis_set.add_geometry(speed_axis_geo)
 
     # create a ContextGeometry for the height axis
     axis_line, axis_arrow, axis_ticks, text_planes, text = \
         profile.height_axis(max_height, vector_spacing * 2, direction, bp,
                             scale_factor, txt_h, feet_labels)
     height_axis = [DisplayLineSegment3D(axis_line), DisplayMesh3D(axis_arrow)]
-    for tic in axis_ticks:
-        height_axis.append(DisplayLineSegment3D(tic))
-    for i, (pl, txt) in enumerate(zip(text_planes, text)):
-        if i != len(text) - 1:
-            txt_i_h, ha, va = txt_h, 'Right', 'Middle'
-        else:
-            txt_i_h, ha, va = txt_h * 1.25, 'Center', 'Bottom'
-        txt_obj = DisplayText3D(txt, pl, txt_i_h, None, legend_par.font, ha, va)
-        height_axis.append(txt_obj)
+    height_axis.extend(DisplayLineSegment3D(tic) for tic in axis_ticks)
+    height_axis.extend(
+        DisplayText3D(txt, pl, txt_h, None, font, 'Right', 'Middle')
+        for pl, txt in zip(text_planes[:-1], text[:-1]))
+    height_axis.append(DisplayText3D(  # the last label is the axis title
+        text[-1], text_planes[-1], txt_h * 1.25, None, font, 'Center', 'Bottom'))
     height_axis_geo = ContextGeometry('Height_Axis', height_axis)
     height_axis_geo.display_name = 'Height Axis'
-    vis_set.add_geometry(height_axis_geo)
 
+    # create the VisualizationSet with all of the geometry
+    vis_set = VisualizationSet(
+        'WindProfile_{}'.format(int(met_ws)),
+        (a_geo, profile_geo, speed_axis_geo, height_axis_geo))
+    vis_set.display_name = 'Wind Profile'
     return vis_set
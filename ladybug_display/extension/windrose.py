@@ -1,7 +1,6 @@
 """Method to draw a WindRose as a VisualizationSet."""
 import math
 
-from ladybug_geometry.geometry2d import Polyline2D
 from ladybug_geometry.geometry3d import Vector3D, Point3D, Plane, LineSegment3D, \
     Polyline3D, Mesh3D
 
@@ -35,32 +34,31 @@ def wind_rose_to_vis_set(windrose, z=0, frequency_labels=True):
 
         -   Analysis_Data -- An AnalysisGeometry for the wind rose data.
     """
-    # establish the VisualizationSet object
+    # get an identifier for the VisualizationSet object
     wr_metadata = windrose.analysis_data_collection.header.metadata
     set_id = 'Wind_Rose_{}'.format(wr_metadata['city'].replace(' ', '_')) \
         if wr_metadata is not None \
         and 'city' in wr_metadata else 'Wind_Rose'
-    vis_set = VisualizationSet(set_id, ())
 
     # add the compass to the bottom of the path
     legend_par = windrose.legend.legend_parameters
     font, txt_h = legend_par.font, legend_par.text_height
-    vis_set.add_geometry(compass_to_vis_set(windrose.compass, z=z, font=font)[0])
+    compass_geo = compass_to_vis_set(windrose.compass, z=z, font=font)[0]
 
     # add the orientation lines
-    orient_line = [LineSegment3D.from_line_segment2d(seg, z) for seg in
-                   windrose.orientation_lines]
-    dis_orient = []
-    for lin in orient_line:
-        dis_orient.append(DisplayLineSegment3D(lin, line_width=1, line_type='Dotted'))
+    dis_orient = [DisplayLineSegment3D(LineSegment3D.from_line_segment2d(seg, z),
+                                       line_width=1, line_type='Dotted')
+                  for seg in windrose.orientation_lines]
     orient_geo = ContextGeometry('Orientation_Lines', dis_orient)
     orient_geo.display_name = 'Orientation Lines'
-    vis_set.add_geometry(orient_geo)
 
     # add the frequency lines
     wr_pln = Plane(o=Point3D(0, 0, z))
-    freq_line = [Polyline3D.from_polyline2d(Polyline2D.from_polygon(poly), wr_pln)
-                 for poly in windrose.frequency_lines[:-1]]
+    freq_line = []
+    for poly in windrose.frequency_lines[:-1]:  # closed polylines at the z value
+        verts = [Point3D(pt.x, pt.y, z) for pt in poly.vertices]
+        verts.append(verts[0])
+        freq_line.append(Polyline3D(verts))
     dis_freq, freq_text = [], []
     for lin in freq_line:
         dis_freq.append(DisplayPolyline3D(lin, line_width=1, line_type='Dotted'))
@@ -70,15 +68,12 @@ def wind_rose_to_vis_set(windrose, z=0, frequency_labels=True):
         f_int = windrose.frequency_hours
         txt_h = min((windrose.frequency_spacing_distance / 4, txt_h))
         freqs = range(0, f_int * windrose.frequency_intervals_compass, f_int)
-        for i, (lin, val) in enumerate(zip(freq_line, freqs)):
-            if i % 2 == 0 and i != 0:
-                b_pln = Plane(o=lin.segments[0].midpoint, x=b_pln_x)
-                d_txt = DisplayText3D(str(val), b_pln, txt_h, None, font,
-                                      'Center', 'Bottom')
-                freq_text.append(d_txt)
+        for lin, val in zip(freq_line[2::2], freqs[2::2]):  # label every other line
+            b_pln = Plane(o=lin.segments[0].midpoint, x=b_pln_x)
+            d_txt = DisplayText3D(str(val), b_pln, txt_h, None, font, 'Center', 'Bottom')
+            freq_text.append(d_txt)
     freq_geo = ContextGeometry('Frequency_Lines', dis_freq + freq_text)
     freq_geo.display_name = 'Frequency Lines'
-    vis_set.add_geometry(freq_geo)
 
     # add the colored mesh
     msh = Mesh3D.from_mesh2d(windrose.colored_mesh, wr_pln)
@@ -89,6 +84,6 @@ def wind_rose_to_vis_set(windrose, z=0, frequency_labels=True):
     mesh_geo = AnalysisGeometry('Analysis_Data', [msh], [vis_data])
     mesh_geo.display_name = data_type.name
     mesh_geo.display_mode = 'SurfaceWithEdges'
-    vis_set.add_geometry(mesh_geo)
 
-    return vis_set
+    # create the VisualizationSet with all of the geometry
+    return VisualizationSet(set_id, (compass_geo, orient_geo, freq_geo, mesh_geo))
@@ -4,7 +4,8 @@ import math
 
 from ladybug.color import Color
 
-from ladybug_display._base import _DisplayBase, LINE_TYPES, DISPLAY_MODES
+from ladybug_display._base import _DisplayBase, LINE_TYPES, DISPLAY_MODES, \
+    _LINE_TYPES_LOWER, _DISPLAY_MODES_LOWER
 from ladybug_display.altnumber import default
 from ladybug_display.typing import float_positive
 
@@ -133,16 +134,12 @@ class _SingleColorModeBase2D(_SingleColorBase2D):
 
     @display_mode.setter
     def display_mode(self, value):
-        clean_input = value.lower()
-        for key in DISPLAY_MODES:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        clean_value = _DISPLAY_MODES_LOWER.get(value.lower())
+        if clean_value is None:
             raise ValueError(
                 'display_mode {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, DISPLAY_MODES))
-        self._display_mode = value
+        self._display_mode = clean_value
 
 
 class _LineCurveBase2D(_SingleColorBase2D):
@@ -199,13 +196,9 @@ class _LineCurveBase2D(_SingleColorBase2D):
 
     @line_type.setter
     def line_type(self, value):
-        clean_input = value.lower()
-        for key in LINE_TYPES:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        clean_value = _LINE_TYPES_LOWER.get(value.lower())
+        if clean_value is None:
             raise ValueError(
                 'line_type {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, LINE_TYPES))
-        self._line_type = value
+        self._line_type = clean_value
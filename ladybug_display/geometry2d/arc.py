@@ -1,8 +1,8 @@
 """An arc that can be displayed in 2D space."""
 from ladybug_geometry.geometry2d.arc import Arc2D
-from ladybug.color import Color
 
-from ladybug_display.altnumber import default
+from ladybug_display.altnumber import default, DEFAULT_DICT
+from .._base import _color_from_dict
 from ._base import _LineCurveBase2D
 
 
@@ -56,15 +56,16 @@ class DisplayArc2D(_LineCurveBase2D):
         """
         assert data['type'] == 'DisplayArc2D', \
             'Expected DisplayArc2D dictionary. Got {}.'.format(data['type'])
-        color = Color.from_dict(data['color']) if 'color' in data and data['color'] \
-            is not None else None
-        lw = default if 'line_width' not in data or \
-            data['line_width'] == default.to_dict() else data['line_width']
-        lt = data['line_type'] if 'line_type' in data and data['line_type'] \
-            is not None else 'Continuous'
+        color = data.get('color')
+        color = _color_from_dict(color) if color is not None else None
+        lw = data.get('line_width', DEFAULT_DICT)
+        lw = default if lw == DEFAULT_DICT else lw
+        lt = data.get('line_type')
+        lt = 'Continuous' if lt is None else lt
         geo = cls(Arc2D.from_dict(data['geometry']), color, lw, lt)
-        if 'user_data' in data and data['user_data'] is not None:
-            geo.user_data = data['user_data']
+        u_data = data.get('user_data')
+        if u_data is not None:
+            geo.user_data = u_data
         return geo
 
     @property
@@ -1,7 +1,7 @@
 """A mesh in 2D space with display properties."""
 from ladybug_geometry.geometry2d.mesh import Mesh2D
-from ladybug.color import Color
 
+from .._base import _color_from_dict
 from ._base import _SingleColorModeBase2D
 
 
@@ -51,13 +51,14 @@ class DisplayMesh2D(_SingleColorModeBase2D):
         """
         assert data['type'] == 'DisplayMesh2D', \
             'Expected DisplayMesh2D dictionary. Got {}.'.format(data['type'])
-        color = Color.from_dict(data['color']) if 'color' in data and data['color'] \
-            is not None else None
-        d_mode = data['display_mode'] if 'display_mode' in data and \
-            data['display_mode'] is not None else 'Surface'
+        color = data.get('color')
+        color = _color_from_dict(color) if color is not None else None
+        d_mode = data.get('display_mode')
+        d_mode = 'Surface' if d_mode is None else d_mode
         geo = cls(Mesh2D.from_dict(data['geometry']), color, d_mode)
-        if 'user_data' in data and data['user_data'] is not None:
-            geo.user_data = data['user_data']
+        u_data = data.get('user_data')
+        if u_data is not None:
+            geo.user_data = u_data
         return geo
 
     @property
@@ -1,9 +1,9 @@
 """A point that can be displayed in 2D space."""
 from ladybug_geometry.geometry2d.pointvector import Point2D
-from ladybug.color import Color
 
+from .._base import _color_from_dict
 from ._base import _SingleColorBase2D
-from ladybug_display.altnumber import default
+from ladybug_display.altnumber import default, DEFAULT_DICT
 from ladybug_display.typing import float_positive
 
 
@@ -44,13 +44,14 @@ class DisplayPoint2D(_SingleColorBase2D):
         """
         assert data['type'] == 'DisplayPoint2D', \
             'Expected DisplayPoint2D dictionary. Got {}.'.format(data['type'])
-        color = Color.from_dict(data['color']) if 'color' in data and data['color'] \
-            is not None else None
-        rad = default if 'radius' not in data or \
-            data['radius'] == default.to_dict() else data['radius']
+        color = data.get('color')
+        color = _color_from_dict(color) if color is not None else None
+        rad = data.get('radius', DEFAULT_DICT)
+        rad = default if rad == DEFAULT_DICT else rad
         geo = cls(Point2D.from_dict(data['geometry']), color, rad)
-        if 'user_data' in data and data['user_data'] is not None:
-            geo.user_data = data['user_data']
+        u_data = data.get('user_data')
+        if u_data is not None:
+            geo.user_data = u_data
         return geo
 
     @property
@@ -95,10 +96,12 @@ class DisplayPoint2D(_SingleColorBase2D):
         return new_g
 
     def __getitem__(self, key):
-        return (self.x, self.y)[key]
+        geo = self._geometry
+        return (geo.x, geo.y)[key]
 
     def __iter__(self):
-        return iter((self.x, self.y))
+        geo = self._geometry
+        return iter((geo.x, geo.y))
 
     def __repr__(self):
         return 'DisplayPoint2D: {}'.format(self.geometry)
@@ -4,7 +4,8 @@ import math
 
 from ladybug.color import Color
 
-from ladybug_display._base import _DisplayBase, DISPLAY_MODES, LINE_TYPES
+from ladybug_display._base import _DisplayBase, DISPLAY_MODES, LINE_TYPES, \
+    _LINE_TYPES_LOWER, _DISPLAY_MODES_LOWER
 from ladybug_display.altnumber import default
 from ladybug_display.typing import float_positive
 
@@ -143,16 +144,12 @@ class _SingleColorModeBase3D(_SingleColorBase3D):
 
     @display_mode.setter
     def display_mode(self, value):
-        clean_input = value.lower()
-        for key in DISPLAY_MODES:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        clean_value = _DISPLAY_MODES_LOWER.get(value.lower())
+        if clean_value is None:
             raise ValueError(
                 'display_mode {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, DISPLAY_MODES))
-        self._display_mode = value
+        self._display_mode = clean_value
 
 
 class _LineCurveBase3D(_SingleColorBase3D):
@@ -209,13 +206,9 @@ class _LineCurveBase3D(_SingleColorBase3D):
 
     @line_type.setter
     def line_type(self, value):
-        clean_input = value.lower()
-        for key in LINE_TYPES:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        clean_value = _LINE_TYPES_LOWER.get(value.lower())
+        if clean_value is None:
             raise ValueError(
                 'line_type {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, LINE_TYPES))
-        self._line_type = value
+        self._line_type = clean_value
@@ -1,7 +1,7 @@
 """A plane that can be displayed in 3D space."""
 from ladybug_geometry.geometry3d.plane import Plane
-from ladybug.color import Color
 
+from .._base import _color_from_dict
 from ._base import _SingleColorBase3D
 
 
@@ -48,13 +48,14 @@ class DisplayPlane(_SingleColorBase3D):
         """
         assert data['type'] == 'DisplayPlane', \
             'Expected DisplayPlane dictionary. Got {}.'.format(data['type'])
-        color = Color.from_dict(data['color']) if 'color' in data and data['color'] \
-            is not None else None
-        ax = data['show_axes'] if 'show_axes' in data else False
-        gd = data['show_grid'] if 'show_grid' in data else False
+        color = data.get('color')
+        color = _color_from_dict(color) if color is not None else None
+        ax = data.get('show_axes', False)
+        gd = data.get('show_grid', False)
         geo = cls(Plane.from_dict(data['geometry']), color, ax, gd)
-        if 'user_data' in data and data['user_data'] is not None:
-            geo.user_data = data['user_data']
+        u_data = data.get('user_data')
+        if u_data is not None:
+            geo.user_data = u_data
         return geo
 
     @property
@@ -1,7 +1,7 @@
 """A polyface in 3D space with display properties."""
 from ladybug_geometry.geometry3d.polyface import Polyface3D
-from ladybug.color import Color
 
+from .._base import _color_from_dict
 from ._base import _SingleColorModeBase3D
 
 
@@ -58,13 +58,14 @@ class DisplayPolyface3D(_SingleColorModeBase3D):
         """
         assert data['type'] == 'DisplayPolyface3D', \
             'Expected DisplayPolyface3D dictionary. Got {}.'.format(data['type'])
-        color = Color.from_dict(data['color']) if 'color' in data and data['color'] \
-            is not None else None
-        d_mode = data['display_mode'] if 'display_mode' in data and \
-            data['display_mode'] is not None else 'Surface'
+        color = data.get('color')
+        color = _color_from_dict(color) if color is not None else None
+        d_mode = data.get('display_mode')
+        d_mode = 'Surface' if d_mode is None else d_mode
         geo = cls(Polyface3D.from_dict(data['geometry']), color, d_mode)
-        if 'user_data' in data and data['user_data'] is not None:
-            geo.user_data = data['user_data']
+        u_data = data.get('user_data')
+        if u_data is not None:
+            geo.user_data = u_data
         return geo
 
     @property
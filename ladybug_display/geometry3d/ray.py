@@ -1,7 +1,7 @@
 """A ray that can be displayed in 3D space."""
 from ladybug_geometry.geometry3d.ray import Ray3D
-from ladybug.color import Color
 
+from .._base import _color_from_dict
 from ._base import _SingleColorBase3D
 
 
@@ -37,11 +37,12 @@ class DisplayRay3D(_SingleColorBase3D):
         """
         assert data['type'] == 'DisplayRay3D', \
             'Expected DisplayRay3D dictionary. Got {}.'.format(data['type'])
-        color = Color.from_dict(data['color']) if 'color' in data and data['color'] \
-            is not None else None
+        color = data.get('color')
+        color = _color_from_dict(color) if color is not None else None
         geo = cls(Ray3D.from_dict(data['geometry']), color)
-        if 'user_data' in data and data['user_data'] is not None:
-            geo.user_data = data['user_data']
+        u_data = data.get('user_data')
+        if u_data is not None:
+            geo.user_data = u_data
         return geo
 
     @property
@@ -1,7 +1,7 @@
 """Class for specifying text within the 3D scene."""
 from ladybug_geometry.geometry3d import Plane, Point3D
-from ladybug.color import Color
 
+from .._base import _color_from_dict
 from ._base import _SingleColorBase3D
 from ladybug_display.typing import float_positive
 
@@ -73,18 +73,19 @@ class DisplayText3D(_SingleColorBase3D):
         """
         assert data['type'] == 'DisplayText3D', \
             'Expected DisplayText3D dictionary. Got {}.'.format(data['type'])
-        color = Color.from_dict(data['color']) if 'color' in data and data['color'] \
-            is not None else None
-        font = data['font'] if 'font' in data and \
-            data['font'] is not None else 'Arial'
-        h_align = data['horizontal_alignment'] if 'horizontal_alignment' in data and \
-            data['horizontal_alignment'] is not None else 'Left'
-        v_align = data['vertical_alignment'] if 'vertical_alignment' in data and \
-            data['vertical_alignment'] is not None else 'Bottom'
+        color = data.get('color')
+        color = _color_from_dict(color) if color is not None else None
+        font = data.get('font')
+        font = 'Arial' if font is None else font
+        h_align = data.get('horizontal_alignment')
+        h_align = 'Left' if h_align is None else h_align
+        v_align = data.get('vertical_alignment')
+        v_align = 'Bottom' if v_align is None else v_align
         geo = cls(data['text'], Plane.from_dict(data['plane']), data['height'],
                   color, font, h_align, v_align)
-        if 'user_data' in data and data['user_data'] is not None:
-            geo.user_data = data['user_data']
+        u_data = data.get('user_data')
+        if u_data is not None:
+            geo.user_data = u_data
         return geo
 
     @property
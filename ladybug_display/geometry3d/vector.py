@@ -4,7 +4,7 @@ import math
 from ladybug_geometry.geometry3d.pointvector import Vector3D
 from ladybug.color import Color
 
-from .._base import _DisplayBase
+from .._base import _DisplayBase, _color_from_dict
 
 
 class DisplayVector3D(_DisplayBase):
@@ -42,11 +42,12 @@ class DisplayVector3D(_DisplayBase):
         """
         assert data['type'] == 'DisplayVector3D', \
             'Expected DisplayVector3D dictionary. Got {}.'.format(data['type'])
-        color = Color.from_dict(data['color']) if 'color' in data and data['color'] \
-            is not None else None
+        color = data.get('color')
+        color = _color_from_dict(color) if color is not None else None
         geo = cls(Vector3D.from_dict(data['geometry']), color)
-        if 'user_data' in data and data['user_data'] is not None:
-            geo.user_data = data['user_data']
+        u_data = data.get('user_data')
+        if u_data is not None:
+            geo.user_data = u_data
         return geo
 
     @property
@@ -145,10 +146,12 @@ class DisplayVector3D(_DisplayBase):
         return new_g
 
     def __getitem__(self, key):
-        return (self.x, self.y, self.z)[key]
+        geo = self._geometry
+        return (geo.x, geo.y, geo.z)[key]
 
     def __iter__(self):
-        return iter((self.x, self.y, self.z))
+        geo = self._geometry
+        return iter((geo.x, geo.y, geo.z))
 
     def __mul__(self, other):
         assert type(other) in (int, float), 'Cannot multiply types {} and {}'.format(
@@ -27,7 +27,7 @@ from .geometry3d import DisplayVector3D, DisplayPoint3D, \
 from ladybug_geometry.bounding import bounding_box
 from ladybug_geometry.dictutil import geometry_dict_to_object
 
-from ._base import DISPLAY_MODES
+from ._base import DISPLAY_MODES, _DISPLAY_MODES_LOWER
 from .geometry2d._base import _DisplayBase2D
 from .geometry3d._base import _DisplayBase3D
 from .typing import int_in_range, valid_string
@@ -1014,16 +1014,12 @@ class AnalysisGeometry(_VisualizationBase):
 
     @display_mode.setter
     def display_mode(self, value):
-        clean_input = value.lower()
-        for key in DISPLAY_MODES:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        clean_value = _DISPLAY_MODES_LOWER.get(value.lower())
+        if clean_value is None:
             raise ValueError(
                 'display_mode {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, DISPLAY_MODES))
-        self._display_mode = value
+        self._display_mode = clean_value
 
     @property
     def hidden(self):
@@ -1523,6 +1519,23 @@ class VisualizationData(VisualizationMetaData):
             new_obj.user_data = data['user_data']
         return new_obj
 
+    @classmethod
+    def from_data_collection(cls, data_collection, legend_parameters=None):
+        """Create VisualizationData from a Ladybug DataCollection.
+
+        Args:
+            data_collection: A Ladybug DataCollection object. The values of the
+                collection will be used to generate the visualization colors and
+                the data type and unit of the collection header will be assigned
+                to the VisualizationData.
+            legend_parameters: An Optional LegendParameters object to override default
+                parameters of the legend. None indicates that default legend parameters
+                will be used. (Default: None).
+        """
+        header = data_collection.header
+        return cls(data_collection.values, legend_parameters,
+                   header.data_type, header.unit)
+
     @property
     def values(self):
         """Get the values assigned to the data set."""
@@ -9,6 +9,9 @@ from ladybug_geometry.geometry3d.mesh import Mesh3D
 from ladybug_geometry.geometry3d.polyface import Polyface3D
 
 from ladybug.futil import nukedir
+from ladybug.header import Header
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.datacollection import HourlyContinuousCollection
 from ladybug.datatype.temperature import Temperature
 from ladybug.datatype.thermalcondition import PredictedMeanVote
 from ladybug.graphic import GraphicContainer
@@ -268,3 +271,17 @@ def test_init_analysis_geometry_data_type_ordinal():
     assert analysis_geo[0].legend_parameters.title == 'PMV'
     assert analysis_geo[0].legend.segment_text == \
         ['Cold', 'Cool', 'Slightly Cool', 'Neutral', 'Slightly Warm', 'Warm', 'Hot']
+
+
+def test_visualization_data_from_data_collection():
+    """Test the initialization of VisualizationData from a DataCollection."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    values = list(range(24))
+    data_c = HourlyContinuousCollection(header, values)
+    data = VisualizationData.from_data_collection(data_c)
+
+    assert len(data) == 24
+    assert list(data.values) == values
+    assert isinstance(data.data_type, Temperature)
+    assert data.unit == 'C'
+    assert data.legend_parameters.title == 'C'